@@ -1,6 +1,8 @@
 import customtkinter as ctk
 import threading
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Set, Tuple
+from .monitor import LoopMonitor, monitor_from_env
+from .pool import DownloaderPool
 from .styles import configure_theme, get_neobrutalist_styles
 from .widgets import (
     UrlInputWidget,
@@ -19,12 +21,18 @@ class VertexApp:
         configure_theme()
         self.styles = get_neobrutalist_styles()
 
-        self.downloader = Downloader()
+        self.pool = DownloaderPool()
         self.selected_option: Optional[DownloadOption] = None
-        self.downloads: List[
-            Tuple[DownloadOption, Downloader, threading.Thread, List]
-        ] = []
+        self.downloads: List[Tuple[DownloadOption, threading.Thread, List]] = []
         self.download_id_counter = 0
+        # Workers are leased on download threads; guarded by downloads_lock
+        self.downloads_lock = threading.Lock()
+        self.download_workers: Dict[int, Downloader] = {}
+        self.finished_downloads: Set[int] = set()
+        self.canceled_downloads: Set[int] = set()
+
+        # Optional event-loop instrumentation (VERTEX_PROFILE=1)
+        self.monitor: Optional[LoopMonitor] = monitor_from_env(self.root)
 
         self._setup_gui()
 
@@ -108,10 +116,13 @@ class VertexApp:
         ).start()
 
     def _fetch_info_thread(self, url: str):
+        downloader = self.pool.acquire()
         try:
-            videos = self.downloader.get_video_info(url)
+            videos = downloader.get_video_info(url)
+            self.pool.release(downloader)
             self.root.after(0, lambda: self._display_info(videos))
         except Exception:
+            self.pool.discard(downloader)
             self.root.after(0, lambda: self._display_error())
         finally:
             self.root.after(0, lambda: self.loading_label.configure(text=""))
@@ -127,7 +138,6 @@ class VertexApp:
         if not option:
             return
 
-        downloader = Downloader()
         download_id = self.download_id_counter
         self.download_id_counter += 1
 
@@ -138,7 +148,6 @@ class VertexApp:
             target=self._download_thread,
             args=(
                 option,
-                downloader,
                 download_id,
                 status_label,
                 progress_label,
@@ -148,7 +157,6 @@ class VertexApp:
         self.downloads.append(
             (
                 option,
-                downloader,
                 download_thread,
                 [frame, status_label, progress_label],
             )
@@ -158,11 +166,22 @@ class VertexApp:
     def _download_thread(
         self,
         option: DownloadOption,
-        downloader: Downloader,
         download_id: int,
         status_label,
         progress_label,
     ):
+        # Leased here rather than on the UI thread, as acquire may build a worker
+        downloader = self.pool.acquire()
+        with self.downloads_lock:
+            canceled = download_id in self.canceled_downloads
+            if not canceled:
+                self.download_workers[download_id] = downloader
+        if canceled:
+            self.pool.release(downloader)
+            self.root.after(0, lambda: self._finish_download(download_id, None, False))
+            return
+
+        succeeded = False
         try:
             downloader.download(
                 option,
@@ -173,6 +192,7 @@ class VertexApp:
                     ),
                 ),
             )
+            succeeded = True
         except Exception:
             self.root.after(
                 0,
@@ -180,6 +200,27 @@ class VertexApp:
                     download_id, DownloadState.FAILED, 0, None
                 ),
             )
+        finally:
+            # Hand the worker back on the UI thread so it cannot race a cancel
+            self.root.after(
+                0,
+                lambda: self._finish_download(download_id, downloader, succeeded),
+            )
+
+    def _finish_download(
+        self, download_id: int, downloader: Optional[Downloader], succeeded: bool
+    ):
+        with self.downloads_lock:
+            self.finished_downloads.add(download_id)
+            self.download_workers.pop(download_id, None)
+            canceled = download_id in self.canceled_downloads
+            self.canceled_downloads.discard(download_id)
+        if downloader is None:
+            return
+        if succeeded and not canceled:
+            self.pool.release(downloader)
+        else:
+            self.pool.discard(downloader)
 
     def _update_download_progress(
         self,
@@ -191,12 +232,28 @@ class VertexApp:
         self.downloads_widget.update_download(download_id, state, downloaded, total)
 
     def _cancel_download(self, download_id: int):
-        if download_id < len(self.downloads):
-            option, downloader, thread, _ = self.downloads[download_id]
-            downloader.cancel()
+        if (
+            download_id < len(self.downloads)
+            and download_id not in self.finished_downloads
+        ):
+            option, thread, _ = self.downloads[download_id]
+            with self.downloads_lock:
+                self.canceled_downloads.add(download_id)
+                downloader = self.download_workers.get(download_id)
+            if downloader is not None:
+                downloader.cancel()
             self.downloads_widget.update_download(
                 download_id, DownloadState.CANCELED, 0, option.file_size
             )
 
     def run(self):
-        self.root.mainloop()
+        if self.monitor is None:
+            self.root.mainloop()
+            return
+
+        self.monitor.start()
+        try:
+            self.root.mainloop()
+        finally:
+            self.monitor.stop()
+            self.monitor.export()
@@ -0,0 +1,181 @@
+import json
+import logging
+import math
+import os
+import sys
+import threading
+import time
+import tkinter
+import traceback
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_INTERVAL_MS = 50
+DEFAULT_STALL_THRESHOLD_MS = 200
+
+
+def monitor_enabled() -> bool:
+    """Instrumentation is opt-in via the VERTEX_PROFILE environment variable."""
+    return os.environ.get("VERTEX_PROFILE", "").lower() in ("1", "true", "yes")
+
+
+def _env_ms(name: str, default: int) -> int:
+    try:
+        value = int(os.environ.get(name, default))
+    except ValueError:
+        logger.warning("Ignoring invalid %s; using %d ms", name, default)
+        return default
+    return max(1, value)
+
+
+def monitor_from_env(root) -> Optional["LoopMonitor"]:
+    """LoopMonitor configured from VERTEX_PROFILE_* variables, or None."""
+    if not monitor_enabled():
+        return None
+    return LoopMonitor(
+        root,
+        interval_ms=_env_ms("VERTEX_PROFILE_INTERVAL_MS", DEFAULT_INTERVAL_MS),
+        stall_threshold_ms=_env_ms(
+            "VERTEX_PROFILE_STALL_MS", DEFAULT_STALL_THRESHOLD_MS
+        ),
+        output_path=os.environ.get("VERTEX_PROFILE_OUTPUT"),
+    )
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of the given samples (0 if empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class LoopMonitor:
+    """Measures Tk event-loop lag and samples the main thread when it stalls.
+
+    A heartbeat scheduled with ``root.after`` records how late each tick fires.
+    A watchdog thread notices when no tick has fired for ``stall_threshold_ms``
+    and logs the main thread's current stack, identifying the blocking call.
+    """
+
+    def __init__(
+        self,
+        root,
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+        stall_threshold_ms: int = DEFAULT_STALL_THRESHOLD_MS,
+        output_path: Optional[str] = None,
+    ):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.stall_threshold_ms = stall_threshold_ms
+        self.output_path = output_path
+        self.latencies: List[float] = []
+        self.stalls: List[dict] = []
+
+        self._main_ident = threading.main_thread().ident
+        self._lock = threading.Lock()
+        self._last_beat = time.perf_counter()
+        self._stall_reported = False
+        self._open_stall: Optional[dict] = None
+        self._stop = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+        self._after_id: Optional[str] = None
+
+    def start(self):
+        self._last_beat = time.perf_counter()
+        self._after_id = self.root.after(
+            self.interval_ms, self._heartbeat, self._last_beat
+        )
+        self._watchdog = threading.Thread(target=self._watch, daemon=True)
+        self._watchdog.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tkinter.TclError:
+                # The root window may already be destroyed
+                pass
+            self._after_id = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+
+    def _heartbeat(self, scheduled_at: float):
+        now = time.perf_counter()
+        # Lag is how much later than requested the callback actually ran
+        lag_ms = max(0.0, (now - scheduled_at) * 1000 - self.interval_ms)
+        with self._lock:
+            self.latencies.append(lag_ms)
+            self._last_beat = now
+            self._stall_reported = False
+            # The watchdog only saw the start of the stall; record its full length
+            stall, self._open_stall = self._open_stall, None
+            if stall is not None:
+                stall["lag_ms"] = round(lag_ms, 1)
+        if lag_ms >= self.stall_threshold_ms:
+            logger.info("Tk event loop resumed after %.1f ms", lag_ms)
+        if not self._stop.is_set():
+            self._after_id = self.root.after(self.interval_ms, self._heartbeat, now)
+
+    def _watch(self):
+        poll = self.interval_ms / 1000
+        while not self._stop.wait(poll):
+            self._check_stall()
+
+    def _check_stall(self):
+        with self._lock:
+            elapsed_ms = (time.perf_counter() - self._last_beat) * 1000
+            overdue = (
+                elapsed_ms - self.interval_ms >= self.stall_threshold_ms
+                and not self._stall_reported
+            )
+            if overdue:
+                self._stall_reported = True
+        if overdue:
+            self._sample_main_thread(elapsed_ms - self.interval_ms)
+
+    def _sample_main_thread(self, lag_ms: float):
+        frame = sys._current_frames().get(self._main_ident)
+        if frame is None:
+            return
+        stack = traceback.format_stack(frame)
+        stall = {"lag_ms": round(lag_ms, 1), "stack": [line.rstrip() for line in stack]}
+        with self._lock:
+            self.stalls.append(stall)
+            self._open_stall = stall
+        logger.warning(
+            "Tk event loop blocked for %.1f ms in:\n%s", lag_ms, "".join(stack)
+        )
+
+    def summary(self) -> dict:
+        with self._lock:
+            latencies = list(self.latencies)
+            stalls = list(self.stalls)
+        return {
+            "samples": len(latencies),
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "max_ms": round(max(latencies, default=0.0), 1),
+            "stall_threshold_ms": self.stall_threshold_ms,
+            "stalls": stalls,
+        }
+
+    def export(self):
+        stats = self.summary()
+        logger.info(
+            "Tk loop latency: p50=%.1f ms p99=%.1f ms max=%.1f ms (%d stalls)",
+            stats["p50_ms"],
+            stats["p99_ms"],
+            stats["max_ms"],
+            len(stats["stalls"]),
+        )
+        if self.output_path:
+            try:
+                with open(self.output_path, "w", encoding="utf-8") as f:
+                    json.dump(stats, f, indent=2)
+            except OSError:
+                logger.exception("Failed to write loop stats to %s", self.output_path)
@@ -0,0 +1,45 @@
+import threading
+from typing import List
+from vertex_downloader.downloader import Downloader
+
+
+class DownloaderPool:
+    """Keeps warmed Downloader workers for reuse by info fetches and downloads.
+
+    Workers are handed out with ``acquire`` and given back with ``release``
+    once a job completes. A worker left in an unknown state (e.g. after a
+    cancel) is retired with ``discard`` and replaced in the background.
+    Workers are always built off the caller's thread except in ``acquire``,
+    which must therefore not be called from the UI loop.
+    """
+
+    def __init__(self, size: int = 2):
+        self.size = size
+        self._lock = threading.Lock()
+        self._idle: List[Downloader] = []
+        for _ in range(size):
+            threading.Thread(target=self._refill, daemon=True).start()
+
+    def acquire(self) -> Downloader:
+        # Fall back to a new worker when all are busy or still warming up
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return Downloader()
+
+    def release(self, downloader: Downloader):
+        with self._lock:
+            if len(self._idle) < self.size and downloader not in self._idle:
+                self._idle.append(downloader)
+
+    def discard(self, downloader: Downloader):
+        with self._lock:
+            if downloader in self._idle:
+                self._idle.remove(downloader)
+            if len(self._idle) >= self.size:
+                return
+        # Warm the replacement off the caller's thread, which may be the UI loop
+        threading.Thread(target=self._refill, daemon=True).start()
+
+    def _refill(self):
+        self.release(Downloader())
@@ -0,0 +1,19 @@
+import threading
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Shared HTTP session that reuses connections per host."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
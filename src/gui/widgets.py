@@ -1,10 +1,12 @@
 import customtkinter as ctk
 from PIL import Image, ImageTk
-import requests
 from io import BytesIO
 from typing import Callable, List, Optional
+from .session import get_session
 from vertex_downloader.models import DownloadOption, DownloadState
 
+THUMBNAIL_TIMEOUT = (3, 5)  # connect, read (seconds)
+
 
 def format_size(bytes_size: Optional[int], downloaded: int = 0) -> str:
     """Format size in kB or MB, showing downloaded/total if total is known."""
@@ -183,7 +185,7 @@ class DownloadOptionsWidget(ctk.CTkFrame):
 
         # Thumbnail
         try:
-            response = requests.get(option.thumbnail)
+            response = get_session().get(option.thumbnail, timeout=THUMBNAIL_TIMEOUT)
             img_data = BytesIO(response.content)
             img = Image.open(img_data).resize((100, 56), Image.LANCZOS)
             photo = ImageTk.PhotoImage(img)
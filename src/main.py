@@ -1,7 +1,13 @@
+import logging
 from gui.app import VertexApp
+from gui.monitor import monitor_enabled
 
 
 def main():
+    if monitor_enabled():
+        logging.basicConfig(
+            level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
+        )
     app = VertexApp()
     app.run()
 
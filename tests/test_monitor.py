@@ -0,0 +1,132 @@
+import json
+import logging
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from gui import monitor  # noqa: E402
+from gui.monitor import LoopMonitor, _env_ms, percentile  # noqa: E402
+
+
+def test_percentile_nearest_rank():
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile(list(range(1, 151)), 99) == 149
+    assert percentile([5, 1, 3], 100) == 5
+    assert percentile([7], 0) == 7
+    assert percentile([], 50) == 0.0
+
+
+def test_env_ms_falls_back_on_bad_values(monkeypatch):
+    monkeypatch.setenv("VERTEX_PROFILE_STALL_MS", "abc")
+    assert _env_ms("VERTEX_PROFILE_STALL_MS", 200) == 200
+    monkeypatch.setenv("VERTEX_PROFILE_INTERVAL_MS", "0")
+    assert _env_ms("VERTEX_PROFILE_INTERVAL_MS", 50) == 1
+
+
+class FakeRoot:
+    def __init__(self):
+        self.pending = {}
+        self._next_id = 0
+
+    def after(self, ms, func, *args):
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.pending[after_id] = (ms, func, args)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(monitor.time, "perf_counter", fake)
+    return fake
+
+
+def test_heartbeat_records_lag_and_reschedules(clock):
+    root = FakeRoot()
+    mon = LoopMonitor(root, interval_ms=50, stall_threshold_ms=200)
+    clock.now = 100.0
+    mon._heartbeat(100.0 - 0.08)  # fired 80 ms after scheduling, 30 ms late
+    assert mon.latencies == [pytest.approx(30.0)]
+    [(ms, func, args)] = root.pending.values()
+    assert ms == 50 and func == mon._heartbeat and args == (100.0,)
+
+    mon._heartbeat(100.0 + 0.01)  # early ticks never count as negative lag
+    assert mon.latencies[-1] == 0.0
+
+
+def test_check_stall_reports_once_until_next_heartbeat(clock):
+    mon = LoopMonitor(FakeRoot(), interval_ms=50, stall_threshold_ms=200)
+    mon._last_beat = 100.0
+    clock.now = 100.1
+    mon._check_stall()
+    assert mon.stalls == []
+
+    clock.now = 100.3
+    mon._check_stall()
+    clock.now = 100.6
+    mon._check_stall()
+    assert len(mon.stalls) == 1
+    assert mon.stalls[0]["lag_ms"] == pytest.approx(250.0)
+    assert mon.stalls[0]["stack"]
+
+    # Loop resumes: the stall record is updated with the full blocked time
+    clock.now = 102.0
+    mon._heartbeat(100.0)
+    assert mon.stalls[0]["lag_ms"] == pytest.approx(1950.0)
+
+    clock.now = 102.3
+    mon._check_stall()
+    assert len(mon.stalls) == 2
+
+
+def test_summary_fields():
+    mon = LoopMonitor(FakeRoot(), stall_threshold_ms=150)
+    mon.latencies = [float(n) for n in range(1, 101)]
+    mon.stalls = [{"lag_ms": 400.0, "stack": []}]
+    assert mon.summary() == {
+        "samples": 100,
+        "p50_ms": 50.0,
+        "p99_ms": 99.0,
+        "max_ms": 100.0,
+        "stall_threshold_ms": 150,
+        "stalls": [{"lag_ms": 400.0, "stack": []}],
+    }
+
+
+def test_export_writes_json(tmp_path):
+    output = tmp_path / "stats.json"
+    mon = LoopMonitor(FakeRoot(), output_path=str(output))
+    mon.latencies = [10.0, 20.0]
+    mon.export()
+    assert json.loads(output.read_text(encoding="utf-8")) == mon.summary()
+
+
+def test_export_logs_write_errors(tmp_path, caplog):
+    mon = LoopMonitor(FakeRoot(), output_path=str(tmp_path / "missing" / "x.json"))
+    with caplog.at_level(logging.ERROR):
+        mon.export()
+    assert "Failed to write loop stats" in caplog.text
+
+
+def test_stop_cancels_pending_heartbeat():
+    root = FakeRoot()
+    mon = LoopMonitor(root, interval_ms=50)
+    mon.start()
+    assert len(root.pending) == 1
+    mon.stop()
+    assert root.pending == {}
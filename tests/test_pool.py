@@ -0,0 +1,85 @@
+import os
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+class FakeDownloader:
+    pass
+
+
+@pytest.fixture
+def pool_module(monkeypatch):
+    package = types.ModuleType("vertex_downloader")
+    downloader = types.ModuleType("vertex_downloader.downloader")
+    downloader.Downloader = FakeDownloader
+    monkeypatch.setitem(sys.modules, "vertex_downloader", package)
+    monkeypatch.setitem(sys.modules, "vertex_downloader.downloader", downloader)
+    monkeypatch.delitem(sys.modules, "gui.pool", raising=False)
+    from gui import pool
+
+    return pool
+
+
+def wait_for(condition, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def wait_for_workers():
+    # Let background warm-up/refill threads finish
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread() and thread.daemon:
+            thread.join(timeout=1)
+
+
+@pytest.fixture
+def pool(pool_module):
+    pool = pool_module.DownloaderPool(size=2)
+    wait_for(lambda: len(pool._idle) == 2)
+    return pool
+
+
+def test_acquire_falls_back_to_new_worker_when_empty(pool):
+    first, second = pool.acquire(), pool.acquire()
+    assert pool._idle == []
+    extra = pool.acquire()
+    assert isinstance(extra, FakeDownloader)
+    assert extra is not first and extra is not second
+
+
+def test_release_caps_idle_and_ignores_duplicates(pool):
+    workers = [pool.acquire() for _ in range(3)]
+    pool.release(workers[0])
+    pool.release(workers[0])
+    assert pool._idle == [workers[0]]
+    pool.release(workers[1])
+    pool.release(workers[2])
+    assert pool._idle == [workers[0], workers[1]]
+
+
+def test_discard_replaces_worker(pool):
+    worker = pool.acquire()
+    pool.discard(worker)
+    wait_for(lambda: len(pool._idle) == 2)
+    assert worker not in pool._idle
+
+
+def test_concurrent_discards_do_not_overfill(pool):
+    workers = [pool.acquire() for _ in range(6)]
+    threads = [threading.Thread(target=pool.discard, args=(w,)) for w in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wait_for_workers()
+    assert len(pool._idle) == 2
+    assert not any(w in pool._idle for w in workers)